@@ -257,8 +257,9 @@ class DemoriDatabase {
             });
             
             // Mark as synced
+            const unsyncedIds = new Set(unsyncedContacts.map(c => c.id));
             const updatedContacts = localContacts.map(contact => {
-                if (unsyncedContacts.find(uc => uc.id === contact.id)) {
+                if (unsyncedIds.has(contact.id)) {
                     return { ...contact, synced: true, server_id: result.contact_ids[contact.id] };
                 }
                 return contact;